@@ -15,7 +15,7 @@ import yaml.constructor
 
 # Workspace Imports
 # from eval_engines.util.core import *
-from eval_engines.ngspice.TwoStageClass import *
+from eval_engines.ngspice.TwoStageClass import TwoStageClass
 
 
 # way of ordering the way a yaml file is read
@@ -99,6 +99,10 @@ class TwoStageAmp(gym.Env):
 
         self.specs_ideal = []
         self.specs_id = list(self.specs.keys())
+        # Per-spec sign applied in `reward`: "max" specs are penalized for overshooting
+        self.specs_sign = np.array(
+            [-1.0 if spec_id == "ibias_max" else 1.0 for spec_id in self.specs_id]
+        )
         self.fixed_goal_idx = -1
         self.num_os = len(list(self.specs.values())[0])
 
@@ -238,17 +242,11 @@ class TwoStageAmp(gym.Env):
         """
         Reward: doesn't penalize for overshooting spec, is negative
         """
-        rel_specs = self.lookup(spec, goal_spec)
-        pos_val = []
+        rel_specs = self.lookup(spec, goal_spec) * self.specs_sign
         reward = 0.0
-        for i, rel_spec in enumerate(rel_specs):
-            if self.specs_id[i] == "ibias_max":
-                rel_spec = rel_spec * -1.0  # /10.0
+        for rel_spec in rel_specs:
             if rel_spec < 0:
                 reward += rel_spec
-                pos_val.append(0)
-            else:
-                pos_val.append(1)
 
         return reward if reward < -0.02 else 10
 
@@ -4,7 +4,7 @@ FIXME: description here!
 """
 
 # Std-Lib Imports
-import re, os, copy, random
+import re, os, random
 from typing import Optional, Any
 
 # from dataclasses import dataclass ## FIXME! get this ancient Python version upgraded already
@@ -20,6 +20,10 @@ class NgSpiceWrapper(object):
     # FIXME here why we abs path to tmp?
     BASE_TMP_DIR = os.path.abspath("/tmp/ckt_da")
 
+    # Netlist-line patterns, compiled once rather than per line
+    INCLUDE_RE = re.compile('\.include\s*"(.*?)"')
+    WRDATA_RE = re.compile("wrdata\s*(\w+\.\w+)\s*")
+
     def __init__(self, num_process, yaml_path, path, root_dir=None):
         if root_dir == None:
             self.root_dir = NgSpiceWrapper.BASE_TMP_DIR
@@ -44,10 +48,7 @@ class NgSpiceWrapper(object):
         raw_file.close()
 
     def get_design_name(self, state):
-        fname = self.base_design_name
-        for value in state.values():
-            fname += "_" + str(value)
-        return fname
+        return "_".join([self.base_design_name, *map(str, state.values())])
 
     def create_design(self, state, new_fname):
         design_folder = os.path.join(self.gen_dir, new_fname) + str(
@@ -57,11 +58,15 @@ class NgSpiceWrapper(object):
 
         fpath = os.path.join(design_folder, new_fname + ".cir")
 
-        lines = copy.deepcopy(self.tmp_lines)
+        # Template lines are immutable `str`s; a shallow copy of the list suffices
+        lines = list(self.tmp_lines)
+        # Compile each parameter's pattern once per design, not once per line
+        param_regexes = [
+            (key, value, re.compile("%s=(\S+)" % (key))) for key, value in state.items()
+        ]
         for line_num, line in enumerate(lines):
             if ".include" in line:
-                regex = re.compile('\.include\s*"(.*?)"')
-                found = regex.search(line)
+                found = self.INCLUDE_RE.search(line)
                 if found:
                     # current_fpath = os.path.realpath(__file__)
                     # parent_path = os.path.abspath(os.path.join(current_fpath, os.pardir))
@@ -70,8 +75,7 @@ class NgSpiceWrapper(object):
                     # lines[line_num] = lines[line_num].replace(found.group(1), path_to_model)
                     pass  # do not change the model path
             if ".param" in line:
-                for key, value in state.items():
-                    regex = re.compile("%s=(\S+)" % (key))
+                for key, value, regex in param_regexes:
                     found = regex.search(line)
                     if found:
                         new_replacement = "%s=%s" % (key, str(value))
@@ -79,8 +83,7 @@ class NgSpiceWrapper(object):
                             found.group(0), new_replacement
                         )
             if "wrdata" in line:
-                regex = re.compile("wrdata\s*(\w+\.\w+)\s*")
-                found = regex.search(line)
+                found = self.WRDATA_RE.search(line)
                 if found:
                     replacement = os.path.join(design_folder, found.group(1))
                     lines[line_num] = lines[line_num].replace(